@@ -1,25 +1,34 @@
 """Defines the Python API for interacting with the StreamDeck Configuration UI"""
 import json
 import os
+import shlex
 import threading
 import time
 import tkinter
+from dataclasses import dataclass
 from functools import partial
 from tkinter import filedialog
 from tkinter import messagebox as mb
-from typing import Dict, Tuple, Union, cast
+from typing import Dict, List, Tuple, Union, cast
 from warnings import warn
 
 from PIL import Image, ImageDraw, ImageFont
+from pynput.keyboard import Key
 from PySide2.QtCore import QObject, Signal
 from StreamDeck import DeviceManager
 from StreamDeck.Devices import StreamDeck
 from StreamDeck.ImageHelpers import PILHelper
 
+try:
+    import pyudev
+except ImportError:  # pragma: no cover - hotplug notifications are only available on Linux
+    pyudev = None
+
 import streamdeck_ui.api
 from streamdeck_ui.config import CONFIG_FILE_VERSION, DEFAULT_FONT, FONTS_PATH, STATE_FILE
 
 image_cache: Dict[str, memoryview] = {}
+macro_cache: Dict[str, "CompiledMacro"] = {}
 decks: Dict[str, StreamDeck.StreamDeck] = {}
 state: Dict[str, Dict[str, Union[int, Dict[int, Dict[int, Dict[str, str]]]]]] = {}
 streamdecks_lock = threading.Lock()
@@ -33,6 +42,14 @@ class KeySignalEmitter(QObject):
 streamdesk_keys = KeySignalEmitter()
 
 
+class DeviceSignalEmitter(QObject):
+    device_hotplug = Signal(str, bool)
+
+
+streamdeck_devices = DeviceSignalEmitter()
+hotplug_observer = None
+
+
 class DataModel:
     image = ""
     text = ""
@@ -48,6 +65,54 @@ class DataModel:
     selectedFont = "Open_Sans"
 
 
+@dataclass
+class ButtonState:
+    text: str
+    icon: str
+    text_align: str
+    font_size: int
+    font_color: str
+    selected_font: str
+    command: str
+    keys: str
+    write: str
+    change_brightness: int
+    switch_page: int
+    target_device: str
+
+
+@dataclass
+class CompiledMacro:
+    """The command, keys and text of a button, parsed into the form used when it is pressed"""
+
+    command: str
+    argv: List[str]
+    key_sections: List[List[Union[Key, str, float]]]
+    write: str
+
+
+# Special keywords the user can use in place of their character equivalent. Since + and ,
+# are used to delimit our sections and keys to press, they need to be substituted.
+SPECIAL_KEYS = {"plus": "+", "comma": ","}
+# Key enum members by name, including aliases
+KEY_LOOKUP: Dict[str, Key] = dict(Key.__members__)
+
+# Values of the button settings that have not been set. The target device of a page switch
+# is not listed, since it defaults to the deck the button is on.
+BUTTON_DEFAULTS: Dict[str, Union[str, int]] = {
+    "text": "",
+    "icon": "",
+    "text_align": "center",
+    "font_size": 14,
+    "font_color": "white",
+    "selected_font": "Open_Sans",
+    "command": "",
+    "keys": "",
+    "write": "",
+    "brightness_change": 0,
+    "switch_page": 0,
+}
+
 paste_cache: Dict[str, str] = {}
 
 
@@ -98,6 +163,7 @@ def _open_config(config_file: str):
             )
 
         state = {}
+        macro_cache.clear()
         for deck_id, deck in config["state"].items():
             deck["buttons"] = {
                 int(page_id): {int(button_id): button for button_id, button in buttons.items()}
@@ -173,6 +239,36 @@ def ensure_decks_connected() -> None:
                     render()
 
 
+def _hotplug_callback(device) -> None:
+    """ Callback whenever a hidraw device is added or removed. The udev monitor runs on a
+        background thread, so the event is emitted as a signal to handle it on the UI thread. """
+    if device.action in ("add", "remove"):
+        streamdeck_devices.device_hotplug.emit(device.sys_name, device.action == "add")
+
+
+def start_hotplug_monitor() -> bool:
+    """Starts listening for devices being connected or disconnected. Returns False if
+    hotplug notifications are not supported on this platform."""
+    global hotplug_observer
+
+    if pyudev is None:
+        return False
+
+    if hotplug_observer is None:
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by(subsystem="hidraw")
+            observer = pyudev.MonitorObserver(monitor, callback=_hotplug_callback)
+            observer.start()
+        except Exception as error:
+            # For example when netlink sockets are not available inside a sandbox
+            warn(f"A {error} error occurred when trying to monitor for Stream Decks")
+            return False
+        hotplug_observer = observer
+
+    return True
+
+
 def get_deck(deck_id: str) -> Dict[str, Dict[str, Union[str, Tuple[int, int]]]]:
     return {"type": decks[deck_id].deck_type(), "layout": decks[deck_id].key_layout()}
 
@@ -183,6 +279,97 @@ def _button_state(deck_id: str, page: int, button: int) -> dict:
     return buttons_state.setdefault(button, {})  # type: ignore
 
 
+def get_button_state(deck_id: str, page: int, button: int) -> ButtonState:
+    """Returns a snapshot of all the settings of the specified button"""
+    button_state = _button_state(deck_id, page, button)
+    return ButtonState(
+        text=_setting(button_state, "text"),
+        icon=_setting(button_state, "icon"),
+        text_align=_setting(button_state, "text_align"),
+        font_size=_setting(button_state, "font_size"),
+        font_color=_setting(button_state, "font_color"),
+        selected_font=_setting(button_state, "selected_font"),
+        command=_setting(button_state, "command"),
+        keys=_setting(button_state, "keys"),
+        write=_setting(button_state, "write"),
+        change_brightness=_setting(button_state, "brightness_change"),
+        switch_page=_setting(button_state, "switch_page"),
+        target_device=button_state.get("target_device", deck_id),
+    )
+
+
+def get_page_render_data(deck_id: str, page: int) -> List[Tuple[str, str]]:
+    """Returns the text and icon of every button on the page, indexed by button id"""
+    buttons = cast(dict, state.get(deck_id, {}).get("buttons", {})).get(page, {})
+    render_data = []
+    for button_id in range(decks[deck_id].key_count()):
+        button_state = buttons.get(button_id, {})
+        render_data.append((_setting(button_state, "text"), _setting(button_state, "icon")))
+    return render_data
+
+
+def _setting(button_state: dict, name: str):
+    return button_state.get(name, BUTTON_DEFAULTS[name])
+
+
+def _button_setting(deck_id: str, page: int, button: int, name: str):
+    return _setting(_button_state(deck_id, page, button), name)
+
+
+def _parse_command(command: str) -> List[str]:
+    try:
+        return shlex.split(command)
+    except ValueError as error:
+        print(f"The command '{command}' failed: {error}")
+        return []
+
+
+def _parse_delay(key_name: str) -> float:
+    sleep_time_arg = key_name.split("delay", 1)[1]
+    if not sleep_time_arg:
+        # default if not specified
+        return 0.5
+
+    try:
+        return float(sleep_time_arg)
+    except Exception:
+        print(f"Could not convert sleep time to float '{sleep_time_arg}'")
+        return 0.0
+
+
+def _parse_keys(keys: str) -> List[List[Union[Key, str, float]]]:
+    """Splits the keys into sections of keys to press together. Key names are translated
+    to their enum, or kept as the string itself if not found, and delays become floats."""
+    sections = []
+    for section in keys.replace(" ", "").split(","):
+        section_keys: List[Union[Key, str, float]] = []
+        for key_name in section.split("+"):
+            lower = key_name.lower()
+            if lower.startswith("delay"):
+                section_keys.append(_parse_delay(lower))
+            else:
+                section_keys.append(SPECIAL_KEYS.get(lower) or KEY_LOOKUP.get(lower, key_name))
+        sections.append(section_keys)
+    return sections
+
+
+def get_compiled_macro(deck_id: str, page: int, button: int) -> CompiledMacro:
+    """Returns the parsed actions of the specified button. Buttons are only parsed again
+    after their command, keys or text to write are changed."""
+    key = f"{deck_id}.{page}.{button}"
+    if key not in macro_cache:
+        button_state = _button_state(deck_id, page, button)
+        command = _setting(button_state, "command")
+        keys = _setting(button_state, "keys")
+        macro_cache[key] = CompiledMacro(
+            command=command,
+            argv=_parse_command(command) if command else [],
+            key_sections=_parse_keys(keys) if keys else [],
+            write=_setting(button_state, "write"),
+        )
+    return macro_cache[key]
+
+
 def swap_buttons(deck_id: str, page: int, source_button: int, target_button: int) -> None:
     """Swaps the properties of the source and target buttons"""
     temp = cast(dict, state[deck_id]["buttons"])[page][source_button]
@@ -194,6 +381,8 @@ def swap_buttons(deck_id: str, page: int, source_button: int, target_button: int
     # Clear the cache so images will be recreated on render
     image_cache.pop(f"{deck_id}.{page}.{source_button}", None)
     image_cache.pop(f"{deck_id}.{page}.{target_button}", None)
+    macro_cache.pop(f"{deck_id}.{page}.{source_button}", None)
+    macro_cache.pop(f"{deck_id}.{page}.{target_button}", None)
 
     _save_state()
     render()
@@ -210,7 +399,7 @@ def set_button_text(deck_id: str, page: int, button: int, text: str) -> None:
 
 def get_button_text(deck_id: str, page: int, button: int) -> str:
     """Returns the text set for the specified button"""
-    return _button_state(deck_id, page, button).get("text", "")
+    return _button_setting(deck_id, page, button, "text")
 
 
 def set_font_size(deck_id: str, page: int, button: int, value: int) -> None:
@@ -223,7 +412,7 @@ def set_font_size(deck_id: str, page: int, button: int, value: int) -> None:
 
 def get_font_size(deck_id: str, page: int, button: int) -> int:
     """Returns the font size set for the specified button"""
-    return _button_state(deck_id, page, button).get("font_size", 14)
+    return _button_setting(deck_id, page, button, "font_size")
 
 
 def set_text_align(deck_id: str, page: int, button: int, value: str) -> None:
@@ -236,7 +425,7 @@ def set_text_align(deck_id: str, page: int, button: int, value: str) -> None:
 
 def get_text_align(deck_id: str, page: int, button: int) -> str:
     """Returns the font size set for the specified button"""
-    return _button_state(deck_id, page, button).get("text_align", "center")
+    return _button_setting(deck_id, page, button, "text_align")
 
 
 def set_selected_font(deck_id: str, page: int, button: int, value: str) -> None:
@@ -249,7 +438,7 @@ def set_selected_font(deck_id: str, page: int, button: int, value: str) -> None:
 
 def get_selected_font(deck_id: str, page: int, button: int) -> str:
     """Returns the font size set for the specified button"""
-    return _button_state(deck_id, page, button).get("selected_font", "Open_Sans")
+    return _button_setting(deck_id, page, button, "selected_font")
 
 
 def set_font_color(deck_id: str, page: int, button: int, value: str) -> None:
@@ -262,7 +451,7 @@ def set_font_color(deck_id: str, page: int, button: int, value: str) -> None:
 
 def get_font_color(deck_id: str, page: int, button: int) -> str:
     """Returns the font size set for the specified button"""
-    return _button_state(deck_id, page, button).get("font_color", "white")
+    return _button_setting(deck_id, page, button, "font_color")
 
 
 def set_button_icon(deck_id: str, page: int, button: int, icon: str) -> None:
@@ -289,7 +478,7 @@ def set_target_device(deck_id: str, page: int, button: int, target_device_id: st
 
 def get_button_icon(deck_id: str, page: int, button: int) -> str:
     """Returns the icon set for a particular button"""
-    return _button_state(deck_id, page, button).get("icon", "")
+    return _button_setting(deck_id, page, button, "icon")
 
 
 def set_button_change_brightness(deck_id: str, page: int, button: int, amount: int) -> None:
@@ -302,19 +491,20 @@ def set_button_change_brightness(deck_id: str, page: int, button: int, amount: i
 
 def get_button_change_brightness(deck_id: str, page: int, button: int) -> int:
     """Returns the brightness change set for a particular button"""
-    return _button_state(deck_id, page, button).get("brightness_change", 0)
+    return _button_setting(deck_id, page, button, "brightness_change")
 
 
 def set_button_command(deck_id: str, page: int, button: int, command: str) -> None:
     """Sets the command associated with the button"""
     if get_button_command(deck_id, page, button) != command:
         _button_state(deck_id, page, button)["command"] = command
+        macro_cache.pop(f"{deck_id}.{page}.{button}", None)
         _save_state()
 
 
 def get_button_command(deck_id: str, page: int, button: int) -> str:
     """Returns the command set for the specified button"""
-    return _button_state(deck_id, page, button).get("command", "")
+    return _button_setting(deck_id, page, button, "command")
 
 
 def set_button_switch_page(deck_id: str, page: int, button: int, switch_page: int) -> None:
@@ -326,31 +516,33 @@ def set_button_switch_page(deck_id: str, page: int, button: int, switch_page: in
 
 def get_button_switch_page(deck_id: str, page: int, button: int) -> int:
     """Returns the page switch set for the specified button. 0 implies no page switch."""
-    return _button_state(deck_id, page, button).get("switch_page", 0)
+    return _button_setting(deck_id, page, button, "switch_page")
 
 
 def set_button_keys(deck_id: str, page: int, button: int, keys: str) -> None:
     """Sets the keys associated with the button"""
     if get_button_keys(deck_id, page, button) != keys:
         _button_state(deck_id, page, button)["keys"] = keys
+        macro_cache.pop(f"{deck_id}.{page}.{button}", None)
         _save_state()
 
 
 def get_button_keys(deck_id: str, page: int, button: int) -> str:
     """Returns the keys set for the specified button"""
-    return _button_state(deck_id, page, button).get("keys", "")
+    return _button_setting(deck_id, page, button, "keys")
 
 
 def set_button_write(deck_id: str, page: int, button: int, write: str) -> None:
     """Sets the text meant to be written when button is pressed"""
     if get_button_write(deck_id, page, button) != write:
         _button_state(deck_id, page, button)["write"] = write
+        macro_cache.pop(f"{deck_id}.{page}.{button}", None)
         _save_state()
 
 
 def get_button_write(deck_id: str, page: int, button: int) -> str:
     """Returns the text to be produced when the specified button is pressed"""
-    return _button_state(deck_id, page, button).get("write", "")
+    return _button_setting(deck_id, page, button, "write")
 
 
 def set_brightness(deck_id: str, brightness: int) -> None:
@@ -1,17 +1,14 @@
 """Defines the QT powered interface for configuring Stream Decks"""
 import os
-import shlex
 import sys
 import time
-import tkinter as tk
-from tkinter import filedialog
-from functools import partial
+from functools import lru_cache, partial
 from subprocess import Popen  # nosec - Need to allow users to specify arbitrary commands
-from typing import Callable, Dict
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from pynput.keyboard import Controller, Key
+from pynput.keyboard import Controller
 from PySide2 import QtWidgets
-from PySide2.QtCore import QMimeData, QSize, Qt, QTimer
+from PySide2.QtCore import QMimeData, QSignalBlocker, QSize, Qt, QTimer
 from PySide2.QtGui import QDrag, QIcon, QKeySequence, QMouseEvent
 from PySide2.QtWidgets import (
     QAction,
@@ -43,8 +40,23 @@ BUTTON_DRAG_STYLE = """
     QToolButton:focus{border:none; }
 """
 
-selected_button: QtWidgets.QToolButton
-text_timer = None
+FONT_COLORS = ["white", "black", "blue", "red", "green", "purple", "cyan", "magenta"]
+FONTS = ["Goblin_One", "Open_Sans", "Roboto", "Lobster", "Anton", "Pacifico"]
+TEXT_ALIGNMENTS = ["left", "center", "right"]
+
+# Alternative shortcuts for the edit menu, next to the platform's standard ones
+CUT_SHORTCUT = QKeySequence("Shift+Del")
+COPY_SHORTCUT = QKeySequence("Ctrl+Insert")
+PASTE_SHORTCUT = QKeySequence("Shift+Insert")
+
+change_timers: Dict[str, QTimer] = {}
+# Changes waiting to be applied, with the deck, page and button they were made for
+pending_changes: Dict[
+    str, Tuple[Callable[[str, int, int, Any], None], Any, Tuple[str, int, int], Any]
+] = {}
+# Deck and page currently shown in the UI. Kept up to date by the device list and
+# page tab signals so handlers don't have to query the widgets on every call.
+_current: Dict[str, Any] = {"deck": None, "page": 0}
 dimmer_options = {
     "Never": 0,
     "10 Seconds": 10,
@@ -60,6 +72,14 @@ dimmer_options = {
 }
 
 multiPasteEnabled = False
+keyboard = Controller()
+
+# Interval in milliseconds between brightness steps while the dimmer fades out
+DIMMER_TICK_MS = 10
+# Redraw requests made within this many milliseconds are coalesced into one redraw
+REDRAW_INTERVAL_MS = 16
+redraw_timer: Optional[QTimer] = None
+redraw_ui = None
 
 
 class Dimmer:
@@ -67,8 +87,6 @@ class Dimmer:
     brightness = -1
     __stopped = False
     __dimmer_brightness = -1
-    __timer = None
-    __change_timer = None
 
     def __init__(self, timeout: int, brightness: int, brightness_callback: Callable[[int], None]):
         """ Constructs a new Dimmer instance
@@ -81,15 +99,20 @@ class Dimmer:
         self.timeout = timeout
         self.brightness = brightness
         self.brightness_callback = brightness_callback
+        self.__last_change = 0.0
+        # The timeout is in whole seconds, so let the OS batch this wakeup with others
+        self.__timer = QTimer()
+        self.__timer.setTimerType(Qt.VeryCoarseTimer)
+        self.__timer.setSingleShot(True)
+        self.__timer.timeout.connect(self.change_brightness)
+        self.__change_timer = QTimer()
+        self.__change_timer.timeout.connect(self.change_brightness)
 
     def stop(self) -> None:
         """ Stops the dimmer and sets the brightness back to normal. Call
         reset to start normal dimming operation. """
-        if self.__timer:
-            self.__timer.stop()
-
-        if self.__change_timer:
-            self.__change_timer.stop()
+        self.__timer.stop()
+        self.__change_timer.stop()
 
         self.__dimmer_brightness = self.brightness
         self.brightness_callback(self.brightness)
@@ -100,16 +123,10 @@ class Dimmer:
         immediately stop dimming. Callback fires to set brightness back to normal."""
 
         self.__stopped = False
-        if self.__timer:
-            self.__timer.stop()
-
-        if self.__change_timer:
-            self.__change_timer.stop()
+        self.__timer.stop()
+        self.__change_timer.stop()
 
         if self.timeout:
-            self.__timer = QTimer()
-            self.__timer.setSingleShot(True)
-            self.__timer.timeout.connect(partial(self.change_brightness))
             self.__timer.start(self.timeout * 1000)
 
         if self.__dimmer_brightness != self.brightness:
@@ -128,26 +145,33 @@ class Dimmer:
 
         if toggle and self.__dimmer_brightness == 0:
             self.reset()
-        elif self.__timer and self.__timer.isActive():
+        elif self.__timer.isActive():
             # No need for the timer anymore, stop it
             self.__timer.stop()
 
             # Verify that we're not already at the target brightness nor
             # busy with dimming already
-            if self.__change_timer is None and self.__dimmer_brightness:
+            if not self.__change_timer.isActive() and self.__dimmer_brightness:
                 self.change_brightness()
 
     def change_brightness(self):
-        """ Move the brightness level down by one and schedule another change_brightness event. """
-        if self.__dimmer_brightness:
-            self.__dimmer_brightness = self.__dimmer_brightness - 1
-            self.brightness_callback(self.__dimmer_brightness)
-            self.__change_timer = QTimer()
-            self.__change_timer.setSingleShot(True)
-            self.__change_timer.timeout.connect(partial(self.change_brightness))
-            self.__change_timer.start(10)
+        """ Move the brightness level down by one step for every tick interval that elapsed
+        since the last change, so late ticks still fade in constant time. Stops the
+        repeating change timer once the display is fully dimmed. """
+        now = time.monotonic()
+        if self.__change_timer.isActive():
+            steps = max(1, int((now - self.__last_change) * 1000 / DIMMER_TICK_MS))
         else:
-            self.__change_timer = None
+            steps = 1
+            self.__change_timer.start(DIMMER_TICK_MS)
+        self.__last_change = now
+
+        if self.__dimmer_brightness > 0:
+            self.__dimmer_brightness = max(0, self.__dimmer_brightness - steps)
+            self.brightness_callback(self.__dimmer_brightness)
+
+        if self.__dimmer_brightness <= 0:
+            self.__change_timer.stop()
 
 
 dimmers: Dict[str, Dimmer] = {}
@@ -175,8 +199,6 @@ class DraggableButton(QtWidgets.QToolButton):
         drag.exec_(Qt.MoveAction)
 
     def dropEvent(self, e):  # noqa: N802 - Part of QT signature.
-        global selected_button
-
         self.setStyleSheet(BUTTON_STYLE)
 
         if e.source():
@@ -184,13 +206,14 @@ class DraggableButton(QtWidgets.QToolButton):
             if e.source().index == self.index:
                 return
 
+            flush_changes()
             api.swap_buttons(_deck_id(self.ui), _page(self.ui), e.source().index, self.index)
             # In the case that we've dragged the currently selected button, we have to
             # check the target button instead so it appears that it followed the drag/drop
             if e.source().isChecked():
                 e.source().setChecked(False)
                 self.setChecked(True)
-                selected_button = self
+                self.ui.selected_index = self.index
         else:
             # Handle drag and drop from outside the application
             if e.mimeData().hasUrls:
@@ -210,81 +233,45 @@ class DraggableButton(QtWidgets.QToolButton):
         self.setStyleSheet(BUTTON_STYLE)
 
 
-def _replace_special_keys(key):
-    """Replaces special keywords the user can use with their character equivalent."""
-    if key.lower() == "plus":
-        return "+"
-    if key.lower() == "comma":
-        return ","
-    if key.lower().startswith("delay"):
-        return key.lower()
-    return key
-
-
-def handle_keypress(deck_id: str, key: int, state: bool) -> None:
+def handle_keypress(ui, deck_id: str, key: int, state: bool) -> None:
     if state:
 
         if dimmers[deck_id].reset():
             return
 
-        keyboard = Controller()
         page = api.get_page(deck_id)
+        macro = api.get_compiled_macro(deck_id, page, key)
 
-        command = api.get_button_command(deck_id, page, key)
-        if command:
+        if macro.argv:
             try:
-                Popen(shlex.split(command))
+                Popen(macro.argv)
             except Exception as error:
-                print(f"The command '{command}' failed: {error}")
-
-        keys = api.get_button_keys(deck_id, page, key)
-        if keys:
-            keys = keys.strip().replace(" ", "")
-            for section in keys.split(","):
-                # Since + and , are used to delimit our section and keys to press,
-                # they need to be substituted with keywords.
-                section_keys = [_replace_special_keys(key_name) for key_name in section.split("+")]
-
-                # Translate string to enum, or just the string itself if not found
-                section_keys = [
-                    getattr(Key, key_name.lower(), key_name) for key_name in section_keys
-                ]
-
-                for key_name in section_keys:
-                    if isinstance(key_name, str) and key_name.startswith("delay"):
-                        sleep_time_arg = key_name.split("delay", 1)[1]
-                        if sleep_time_arg:
-                            try:
-                                sleep_time = float(sleep_time_arg)
-                            except Exception:
-                                print(f"Could not convert sleep time to float '{sleep_time_arg}'")
-                                sleep_time = 0
-                        else:
-                            # default if not specified
-                            sleep_time = 0.5
-
-                        if sleep_time:
-                            try:
-                                time.sleep(sleep_time)
-                            except Exception:
-                                print(f"Could not sleep with provided sleep time '{sleep_time}'")
-                    else:
-                        try:
-                            keyboard.press(key_name)
-                        except Exception:
-                            print(f"Could not press key '{key_name}'")
+                print(f"The command '{macro.command}' failed: {error}")
 
-                for key_name in section_keys:
-                    if not (isinstance(key_name, str) and key_name.startswith("delay")):
+        for section_keys in macro.key_sections:
+            for key_name in section_keys:
+                if isinstance(key_name, float):
+                    if key_name:
                         try:
-                            keyboard.release(key_name)
+                            time.sleep(key_name)
                         except Exception:
-                            print(f"Could not release key '{key_name}'")
-
-        write = api.get_button_write(deck_id, page, key)
-        if write:
+                            print(f"Could not sleep with provided sleep time '{key_name}'")
+                else:
+                    try:
+                        keyboard.press(key_name)
+                    except Exception:
+                        print(f"Could not press key '{key_name}'")
+
+            for key_name in section_keys:
+                if not isinstance(key_name, float):
+                    try:
+                        keyboard.release(key_name)
+                    except Exception:
+                        print(f"Could not release key '{key_name}'")
+
+        if macro.write:
             try:
-                keyboard.type(write)
+                keyboard.type(macro.write)
             except Exception as error:
                 print(f"Could not complete the write command: {error}")
 
@@ -301,37 +288,42 @@ def handle_keypress(deck_id: str, key: int, state: bool) -> None:
         target_device = api.get_target_device(deck_id, page, key)
         if switch_page:
             api.set_page(target_device, switch_page - 1)
+            # Keep the UI on the page shown on the deck that is being configured
+            if target_device == _deck_id(ui):
+                ui.pages.setCurrentIndex(api.get_page(target_device))
 
 
 def _deck_id(ui) -> str:
-    return ui.device_list.itemData(ui.device_list.currentIndex())
+    return _current["deck"]
 
 
 def _page(ui) -> int:
-    return ui.pages.currentIndex()
+    return _current["page"]
 
 
-def update_button_text(ui, text: str) -> None:
-    deck_id = _deck_id(ui)
-    api.set_button_text(deck_id, _page(ui), selected_button.index, text)
-    redraw_buttons(ui)
+def _set_current_deck(ui, index: int) -> None:
+    _current["deck"] = ui.device_list.itemData(index)
+
+
+def _set_current_page(page: int) -> None:
+    _current["page"] = page
 
 
 def update_font_size(ui, value: int) -> None:
     deck_id = _deck_id(ui)
-    api.set_font_size(deck_id, _page(ui), selected_button.index, value)
+    api.set_font_size(deck_id, _page(ui), ui.selected_index, value)
     redraw_buttons(ui)
 
 
 def update_font_color(ui, value: str) -> None:
     deck_id = _deck_id(ui)
-    api.set_font_color(deck_id, _page(ui), selected_button.index, value)
+    api.set_font_color(deck_id, _page(ui), ui.selected_index, value)
     redraw_buttons(ui)
 
 
 def update_selected_font(ui, value: str) -> None:
     deck_id = _deck_id(ui)
-    api.set_selected_font(deck_id, _page(ui), selected_button.index, value)
+    api.set_selected_font(deck_id, _page(ui), ui.selected_index, value)
     redraw_buttons(ui)
 
 
@@ -343,42 +335,27 @@ def update_feedback_enabled(ui, value: bool) -> None:
 
 def update_text_align(ui, value: str) -> None:
     deck_id = _deck_id(ui)
-    api.set_text_align(deck_id, _page(ui), selected_button.index, value)
+    api.set_text_align(deck_id, _page(ui), ui.selected_index, value)
     redraw_buttons(ui)
 
 
-def update_button_command(ui, command: str) -> None:
-    deck_id = _deck_id(ui)
-    api.set_button_command(deck_id, _page(ui), selected_button.index, command)
-
-
-def update_button_keys(ui, keys: str) -> None:
-    deck_id = _deck_id(ui)
-    api.set_button_keys(deck_id, _page(ui), selected_button.index, keys)
-
-
-def update_button_write(ui) -> None:
-    deck_id = _deck_id(ui)
-    api.set_button_write(deck_id, _page(ui), selected_button.index, ui.write.toPlainText())
-
-
 def update_change_brightness(ui, amount: int) -> None:
     deck_id = _deck_id(ui)
-    api.set_button_change_brightness(deck_id, _page(ui), selected_button.index, amount)
+    api.set_button_change_brightness(deck_id, _page(ui), ui.selected_index, amount)
 
 
 def update_switch_page(ui, page: int) -> None:
     deck_id = _deck_id(ui)
-    api.set_button_switch_page(deck_id, _page(ui), selected_button.index, page)
+    api.set_button_switch_page(deck_id, _page(ui), ui.selected_index, page)
 
 
 def update_target_device(ui, target_device_id: str) -> None:
     deck_id = _deck_id(ui)
-    api.set_target_device(deck_id, _page(ui), selected_button.index, target_device_id)
+    api.set_target_device(deck_id, _page(ui), ui.selected_index, target_device_id)
 
 
 def _highlight_first_button(ui) -> None:
-    button = ui.pages.currentWidget().findChildren(QtWidgets.QToolButton)[0]
+    button = ui.pages.currentWidget().button_list[0]
     button.setChecked(False)
     button.click()
 
@@ -393,47 +370,33 @@ def change_page(ui, page: int) -> None:
 
 def select_image(window) -> None:
     deck_id = _deck_id(window.ui)
-    image = api.get_button_icon(deck_id, _page(window.ui), selected_button.index)
-    if not image:
-        image = os.path.expanduser("~")
-
-    root = tk.Tk()
-    root.withdraw()
-
-    file_name = filedialog.askopenfilename(initialdir=os.path.dirname(api.get_last_known_folder(deck_id)))
-
-    # file_name = QFileDialog.getOpenFileName(
-    #     window, "Open Image", image, "Image Files (*.png *.jpg *.bmp *.gif)"
-    # )[0]
+    file_name = QFileDialog.getOpenFileName(
+        window,
+        "Open Image",
+        os.path.dirname(api.get_last_known_folder(deck_id)),
+        "Image Files (*.png *.jpg *.bmp *.gif)",
+    )[0]
     if file_name:
-        deck_id = _deck_id(window.ui)
-        api.set_button_icon(deck_id, _page(window.ui), selected_button.index, file_name)
+        api.set_button_icon(deck_id, _page(window.ui), window.ui.selected_index, file_name)
         redraw_buttons(window.ui)
 
 
 def select_image_for_custom_feedback(window) -> None:
     deck_id = _deck_id(window.ui)
-    image = api.get_custom_image_for_feedback(deck_id)
-    if not image:
-        image = os.path.expanduser("~")
-
-    root = tk.Tk()
-    root.withdraw()
-
-    file_name = filedialog.askopenfilename(initialdir=os.path.dirname(api.get_last_known_folder(deck_id)))
-
-    # file_name = QFileDialog.getOpenFileName(
-    #     window, "Open Image", image, "Image Files (*.png *.jpg *.bmp *.gif)"
-    # )[0]
+    file_name = QFileDialog.getOpenFileName(
+        window,
+        "Open Image",
+        os.path.dirname(api.get_last_known_folder(deck_id)),
+        "Image Files (*.png *.jpg *.bmp *.gif)",
+    )[0]
     if file_name:
-        deck_id = _deck_id(window.ui)
         api.set_custom_image_for_feedback(deck_id, file_name)
         api.set_last_known_folder(deck_id, file_name)
 
 
 def remove_image(window) -> None:
     deck_id = _deck_id(window.ui)
-    image = api.get_button_icon(deck_id, _page(window.ui), selected_button.index)
+    image = api.get_button_icon(deck_id, _page(window.ui), window.ui.selected_index)
     if image:
         confirm = QMessageBox(window)
         confirm.setWindowTitle("Remove image")
@@ -442,19 +405,40 @@ def remove_image(window) -> None:
         confirm.setIcon(QMessageBox.Question)
         button = confirm.exec_()
         if button == QMessageBox.Yes:
-            api.set_button_icon(deck_id, _page(window.ui), selected_button.index, "")
+            api.set_button_icon(deck_id, _page(window.ui), window.ui.selected_index, "")
             redraw_buttons(window.ui)
 
 
+@lru_cache(maxsize=256)
+def _icon(path: str) -> QIcon:
+    return QIcon(path)
+
+
 def redraw_buttons(ui) -> None:
-    deck_id = _deck_id(ui)
-    current_tab = ui.pages.currentWidget()
-    buttons = current_tab.findChildren(QtWidgets.QToolButton)
-    for button in buttons:
-        button.setText(
-            api.get_button_text(deck_id, _page(ui), button.index).replace("\\n", os.linesep)
-        )
-        button.setIcon(QIcon(api.get_button_icon(deck_id, _page(ui), button.index)))
+    """Schedules the buttons of the current page to be redrawn. Multiple requests in quick
+    succession result in a single redraw."""
+    global redraw_timer, redraw_ui
+
+    redraw_ui = ui
+    if redraw_timer is None:
+        redraw_timer = QTimer()
+        redraw_timer.setSingleShot(True)
+        redraw_timer.timeout.connect(_redraw_pending_buttons)
+
+    if not redraw_timer.isActive():
+        redraw_timer.start(REDRAW_INTERVAL_MS)
+
+
+def _redraw_pending_buttons() -> None:
+    if redraw_ui is not None:
+        _draw_buttons(redraw_ui)
+
+
+def _draw_buttons(ui) -> None:
+    render_data = api.get_page_render_data(_deck_id(ui), _page(ui))
+    for button, (text, icon) in zip(ui.pages.currentWidget().button_list, render_data):
+        button.setText(text.replace("\\n", os.linesep))
+        button.setIcon(_icon(icon))
 
 
 def set_brightness(ui, value: int) -> None:
@@ -464,31 +448,46 @@ def set_brightness(ui, value: int) -> None:
     dimmers[deck_id].reset()
 
 
-def button_clicked(ui, clicked_button, buttons) -> None:
-    global selected_button
-    selected_button = clicked_button
-
-    for button in buttons:
-        if button == clicked_button:
-            continue
-
-        button.setChecked(False)
-
-    selected_button.setFocus()
+def button_clicked(ui, clicked_button) -> None:
+    # Pending edits belong to the previously selected button
+    flush_changes()
+    ui.selected_index = clicked_button.index
+    clicked_button.setFocus()
 
     deck_id = _deck_id(ui)
-    button_id = selected_button.index
-    ui.text.setText(api.get_button_text(deck_id, _page(ui), button_id))
-    ui.text_Align.setCurrentText(api.get_text_align(deck_id, _page(ui), button_id))
-    ui.font_Size.setValue(api.get_font_size(deck_id, _page(ui), button_id))
-    ui.font_Color.setCurrentText(api.get_font_color(deck_id, _page(ui), button_id))
-    ui.command.setText(api.get_button_command(deck_id, _page(ui), button_id))
-    ui.keys.setText(api.get_button_keys(deck_id, _page(ui), button_id))
-    ui.write.setPlainText(api.get_button_write(deck_id, _page(ui), button_id))
-    ui.change_brightness.setValue(api.get_button_change_brightness(deck_id, _page(ui), button_id))
-    ui.switch_page.setValue(api.get_button_switch_page(deck_id, _page(ui), button_id))
-    ui.target_device.setCurrentText(api.get_target_device(deck_id, _page(ui), button_id))
-    ui.selected_font.setCurrentText(api.get_selected_font(deck_id, _page(ui), button_id))
+    button_state = api.get_button_state(deck_id, _page(ui), ui.selected_index)
+
+    # Filling in the fields should not write the same values back to the button
+    blockers = [
+        QSignalBlocker(widget)
+        for widget in (
+            ui.text,
+            ui.text_Align,
+            ui.font_Size,
+            ui.font_Color,
+            ui.command,
+            ui.keys,
+            ui.write,
+            ui.change_brightness,
+            ui.switch_page,
+            ui.target_device,
+            ui.selected_font,
+        )
+    ]
+    ui.text.setText(button_state.text)
+    ui.text_Align.setCurrentText(button_state.text_align)
+    ui.font_Size.setValue(button_state.font_size)
+    ui.font_Color.setCurrentText(button_state.font_color)
+    ui.command.setText(button_state.command)
+    ui.keys.setText(button_state.keys)
+    ui.write.setPlainText(button_state.write)
+    ui.change_brightness.setValue(button_state.change_brightness)
+    ui.switch_page.setValue(button_state.switch_page)
+    ui.target_device.setCurrentText(button_state.target_device)
+    ui.selected_font.setCurrentText(button_state.selected_font)
+    for blocker in blockers:
+        blocker.unblock()
+
     dimmers[deck_id].reset()
 
 
@@ -496,6 +495,12 @@ def build_buttons(ui, tab) -> None:
     deck_id = _deck_id(ui)
     deck = api.get_deck(deck_id)
 
+    # The buttons can be reused when the layout of the deck did not change
+    if getattr(tab, "deck_layout", None) == deck["layout"] and hasattr(tab, "button_list"):
+        for button in tab.button_list:
+            button.ui = ui
+        return
+
     if hasattr(tab, "deck_buttons"):
         tab.deck_buttons.hide()
         tab.deck_buttons.deleteLater()
@@ -504,6 +509,10 @@ def build_buttons(ui, tab) -> None:
     tab.children()[0].addWidget(base_widget)
     tab.deck_buttons = base_widget
 
+    # The exclusive group makes sure only the selected button is checked
+    button_group = QtWidgets.QButtonGroup(base_widget)
+    button_group.setExclusive(True)
+
     row_layout = QtWidgets.QVBoxLayout(base_widget)
     index = 0
     buttons = []
@@ -520,16 +529,17 @@ def build_buttons(ui, tab) -> None:
             button.setIconSize(QSize(100, 100))
             button.setStyleSheet(BUTTON_STYLE)
             buttons.append(button)
+            button_group.addButton(button, index)
             column_layout.addWidget(button)
             index += 1
 
-    for button in buttons:
-        button.clicked.connect(
-            lambda button=button, buttons=buttons: button_clicked(ui, button, buttons)
-        )
+    tab.button_list = buttons
+    tab.deck_layout = deck["layout"]
+    button_group.buttonClicked.connect(partial(button_clicked, ui))
 
 
 def export_config(window) -> None:
+    flush_changes()
     deck_id = _deck_id(window.ui)
     valueLocation = api.get_last_known_export_folder(deck_id)
     file_name = QFileDialog.getSaveFileName(
@@ -543,16 +553,14 @@ def export_config(window) -> None:
 
 
 def import_config(window) -> None:
+    flush_changes()
     deck_id = _deck_id(window.ui)
-    valueLocation = api.get_last_known_import_folder(deck_id)
-    root = tk.Tk()
-    root.withdraw()
-
-    file_name = filedialog.askopenfilename(initialdir=os.path.dirname(api.get_last_known_import_folder(deck_id)))
-
-    # file_name = QFileDialog.getOpenFileName(
-    #     window, "Import Config", valueLocation, "Config Files (*.json)"
-    # )[0]
+    file_name = QFileDialog.getOpenFileName(
+        window,
+        "Import Config",
+        os.path.dirname(api.get_last_known_import_folder(deck_id)),
+        "Config Files (*.json)",
+    )[0]
     if not file_name:
         return
 
@@ -562,30 +570,36 @@ def import_config(window) -> None:
 
 
 def cut_button(window) -> None:
+    flush_changes()
     deck_id = _deck_id(window.ui)
-    api.edit_menu_cut_button(deck_id, _page(window.ui), selected_button.index)
+    api.edit_menu_cut_button(deck_id, _page(window.ui), window.ui.selected_index)
     redraw_buttons(window.ui)
     _highlight_first_button(window.ui)
 
 
 def copy_button(window) -> None:
+    flush_changes()
     deck_id = _deck_id(window.ui)
-    api.edit_menu_copy_button(deck_id, _page(window.ui), selected_button.index)
+    api.edit_menu_copy_button(deck_id, _page(window.ui), window.ui.selected_index)
     redraw_buttons(window.ui)
 
 
 def paste_button(window) -> None:
     global multiPasteEnabled
 
+    flush_changes()
     deck_id = _deck_id(window.ui)
-    api.edit_menu_paste_button(deck_id, _page(window.ui), selected_button.index, multiPasteEnabled)
+    api.edit_menu_paste_button(
+        deck_id, _page(window.ui), window.ui.selected_index, multiPasteEnabled
+    )
     redraw_buttons(window.ui)
     _highlight_first_button(window.ui)
 
 
 def delete_button(window) -> None:
+    flush_changes()
     deck_id = _deck_id(window.ui)
-    api.edit_menu_delete_button(deck_id, _page(window.ui), selected_button.index)
+    api.edit_menu_delete_button(deck_id, _page(window.ui), window.ui.selected_index)
     redraw_buttons(window.ui)
     _highlight_first_button(window.ui)
 
@@ -610,6 +624,65 @@ def sync(ui) -> None:
     ui.pages.setCurrentIndex(api.get_page(_deck_id(ui)))
 
 
+def add_decks(ui, decks: Dict[str, Dict]) -> None:
+    """Adds newly opened decks to the device list and shows the selected one."""
+    # Signals stay blocked until the first deck is fully set up, build_device is then
+    # called explicitly to draw it.
+    ui.device_list.blockSignals(True)
+    ui.target_device.blockSignals(True)
+    for deck_id, deck in decks.items():
+        ui.device_list.addItem(f"{deck['type']} - {deck_id}", userData=deck_id)
+        ui.target_device.addItem(deck_id)
+        dimmers[deck_id] = Dimmer(
+            api.get_display_timeout(deck_id),
+            api.get_brightness(deck_id),
+            partial(change_brightness, deck_id),
+        )
+        dimmers[deck_id].reset()
+    ui.device_list.blockSignals(False)
+    ui.target_device.blockSignals(False)
+
+    _set_current_deck(ui, ui.device_list.currentIndex())
+    build_device(ui)
+
+
+def _enable_deck_controls(ui, enabled: bool) -> None:
+    """Enables or disables everything that acts on the selected deck. Disabling the menus
+    alone would leave their actions reachable through the keyboard shortcuts."""
+    ui.centralwidget.setEnabled(enabled)
+    ui.menuEdit.setEnabled(enabled)
+    for action in (
+        ui.actionImport,
+        ui.actionExport,
+        ui.actionCut,
+        ui.actionCopy,
+        ui.actionPaste,
+        ui.actionDelete,
+        ui.actionMultiPaste,
+    ):
+        action.setEnabled(enabled)
+
+
+def connect_decks(ui) -> None:
+    """Shows the decks once the first one is plugged in. After that, reconnects decks
+    that were unplugged."""
+    if ui.device_list.count():
+        sync(ui)
+        return
+
+    decks = api.open_decks()
+    if decks:
+        ui.statusbar.clearMessage()
+        add_decks(ui, decks)
+        _enable_deck_controls(ui, True)
+        # Opening the decks cleared their keys
+        api.render()
+
+
+def on_hotplug(ui, _device: str, _present: bool) -> None:
+    connect_decks(ui)
+
+
 def build_device(ui, _device_index=None) -> None:
     for page_id in range(ui.pages.count()):
         page = ui.pages.widget(page_id)
@@ -630,6 +703,7 @@ class MainWindow(QMainWindow):
         super(MainWindow, self).__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        self.ui.selected_index = 0
         self.window_shown: bool = True
 
     def closeEvent(self, event) -> None:  # noqa: N802 - Part of QT signature.
@@ -652,16 +726,37 @@ class MainWindow(QMainWindow):
         self.window_shown = True
 
 
-def queue_text_change(ui, text: str) -> None:
-    global text_timer
+def _apply_change(key: str) -> None:
+    change = pending_changes.pop(key, None)
+    if change:
+        setter, ui, (deck_id, page, button), value = change
+        setter(deck_id, page, button, value)
+        redraw_buttons(ui)
+
 
-    if text_timer:
-        text_timer.stop()
+def queue_change(
+    key: str, ui, setter: Callable[[str, int, int, Any], None], value: Any, delay: int = 300
+) -> None:
+    """Schedules the api setter to store value on the selected button once no further change
+    for the same key has been queued for delay milliseconds, so a burst of edits results in
+    a single update. The button is the one selected now, even if the selection changes
+    before the change is applied."""
+    pending_changes[key] = (setter, ui, (_deck_id(ui), _page(ui), ui.selected_index), value)
 
-    text_timer = QTimer()
-    text_timer.setSingleShot(True)
-    text_timer.timeout.connect(partial(update_button_text, ui, text))
-    text_timer.start(500)
+    timer = change_timers.get(key)
+    if timer is None:
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(partial(_apply_change, key))
+        change_timers[key] = timer
+    timer.start(delay)
+
+
+def flush_changes() -> None:
+    """Immediately applies any changes that are still waiting in queue_change."""
+    for key, timer in change_timers.items():
+        timer.stop()
+        _apply_change(key)
 
 
 def change_brightness(deck_id: str, brightness: int):
@@ -687,8 +782,7 @@ def show_settings(window) -> None:
     settings = SettingsDialog(window)
     dimmers[deck_id].stop()
 
-    settings.ui.buttonfeedback.addItem("Disabled")
-    settings.ui.buttonfeedback.addItem("Enabled")
+    settings.ui.buttonfeedback.addItems(["Disabled", "Enabled"])
 
     if api.get_feedback_enabled(deck_id) == "Enabled":
         settings.ui.buttonfeedback.setCurrentIndex(1)
@@ -755,6 +849,11 @@ def start(_exit: bool = False) -> None:
     main_window = MainWindow()
     ui = main_window.ui
     main_window.setWindowIcon(logo)
+
+    # Connected before any other handlers, so they always see the new deck and page
+    _set_current_page(ui.pages.currentIndex())
+    ui.device_list.currentIndexChanged.connect(partial(_set_current_deck, ui))
+    ui.pages.currentChanged.connect(_set_current_page)
     tray = QSystemTrayIcon(logo, app)
     tray.activated.connect(main_window.systray_clicked)
 
@@ -772,60 +871,39 @@ def start(_exit: bool = False) -> None:
 
     tray.setContextMenu(menu)
 
-    ui.text.textChanged.connect(partial(queue_text_change, ui))
+    ui.text.textChanged.connect(partial(queue_change, "text", ui, api.set_button_text))
     ui.font_Size.valueChanged.connect(partial(update_font_size, ui))
-    ui.command.textChanged.connect(partial(update_button_command, ui))
-    ui.keys.textChanged.connect(partial(update_button_keys, ui))
-    ui.write.textChanged.connect(partial(update_button_write, ui))
+    ui.command.textChanged.connect(partial(queue_change, "command", ui, api.set_button_command))
+    ui.keys.textChanged.connect(partial(queue_change, "keys", ui, api.set_button_keys))
+    ui.write.textChanged.connect(
+        lambda: queue_change("write", ui, api.set_button_write, ui.write.toPlainText())
+    )
     ui.change_brightness.valueChanged.connect(partial(update_change_brightness, ui))
     ui.switch_page.valueChanged.connect(partial(update_switch_page, ui))
     ui.imageButton.clicked.connect(partial(select_image, main_window))
     ui.removeButton.clicked.connect(partial(remove_image, main_window))
     ui.settingsButton.clicked.connect(partial(show_settings, main_window))
 
-    ui.font_Color.addItem("white")
-    ui.font_Color.addItem("black")
-    ui.font_Color.addItem("blue")
-    ui.font_Color.addItem("red")
-    ui.font_Color.addItem("green")
-    ui.font_Color.addItem("purple")
-    ui.font_Color.addItem("cyan")
-    ui.font_Color.addItem("magenta")
+    ui.font_Color.addItems(FONT_COLORS)
     ui.font_Color.currentTextChanged.connect(partial(update_font_color, ui))
 
-    ui.selected_font.addItem("Goblin_One")
-    ui.selected_font.addItem("Open_Sans")
-    ui.selected_font.addItem("Roboto")
-    ui.selected_font.addItem("Lobster")
-    ui.selected_font.addItem("Anton")
-    ui.selected_font.addItem("Pacifico")
+    ui.selected_font.addItems(FONTS)
     ui.selected_font.currentTextChanged.connect(partial(update_selected_font, ui))
 
-    ui.text_Align.addItem("left")
-    ui.text_Align.addItem("center")
-    ui.text_Align.addItem("right")
+    ui.text_Align.addItems(TEXT_ALIGNMENTS)
     ui.text_Align.currentTextChanged.connect(partial(update_text_align, ui))
 
-    api.streamdesk_keys.key_pressed.connect(handle_keypress)
+    api.streamdesk_keys.key_pressed.connect(partial(handle_keypress, ui))
 
-    items = api.open_decks().items()
-    if len(items) == 0:
+    decks = api.open_decks()
+    if decks:
+        add_decks(ui, decks)
+    else:
+        # The decks are added by connect_decks once one is plugged in
         print("Waiting for Stream Deck(s)...")
-        while len(items) == 0:
-            time.sleep(3)
-            items = api.open_decks().items()
-
-    for deck_id, deck in items:
-        ui.device_list.addItem(f"{deck['type']} - {deck_id}", userData=deck_id)
-        ui.target_device.addItem(deck_id)
-        dimmers[deck_id] = Dimmer(
-            api.get_display_timeout(deck_id),
-            api.get_brightness(deck_id),
-            partial(change_brightness, deck_id),
-        )
-        dimmers[deck_id].reset()
+        ui.statusbar.showMessage("Waiting for Stream Deck(s)...")
+        _enable_deck_controls(ui, False)
 
-    build_device(ui)
     ui.device_list.currentIndexChanged.connect(partial(build_device, ui))
 
     ui.target_device.currentTextChanged.connect(partial(update_target_device, ui))
@@ -838,9 +916,9 @@ def start(_exit: bool = False) -> None:
     ui.actionCut.triggered.connect(partial(cut_button, main_window))
     ui.actionCopy.triggered.connect(partial(copy_button, main_window))
 
-    ui.actionCut.setShortcuts([QKeySequence.Cut, QKeySequence("Shift+Del")])
-    ui.actionCopy.setShortcuts([QKeySequence.Copy, QKeySequence("Ctrl+Insert")])
-    ui.actionPaste.setShortcuts([QKeySequence.Paste, QKeySequence("Shift+Insert")])
+    ui.actionCut.setShortcuts([QKeySequence.Cut, CUT_SHORTCUT])
+    ui.actionCopy.setShortcuts([QKeySequence.Copy, COPY_SHORTCUT])
+    ui.actionPaste.setShortcuts([QKeySequence.Paste, PASTE_SHORTCUT])
     ui.actionDelete.setShortcuts([QKeySequence.Delete])
 
     ui.actionPaste.triggered.connect(partial(paste_button, main_window))
@@ -849,9 +927,13 @@ def start(_exit: bool = False) -> None:
 
     ui.actionExit.triggered.connect(app.exit)
 
-    timer = QTimer()
-    timer.timeout.connect(partial(sync, ui))
-    timer.start(1000)
+    api.streamdeck_devices.device_hotplug.connect(partial(on_hotplug, ui))
+    if not api.start_hotplug_monitor():
+        # No hotplug notifications on this platform, poll for plugged in decks instead
+        timer = QTimer()
+        timer.setTimerType(Qt.VeryCoarseTimer)
+        timer.timeout.connect(partial(connect_decks, ui))
+        timer.start(1000)
 
     api.render()
     tray.show()
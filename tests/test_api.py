@@ -1,4 +1,5 @@
 from hypothesis_auto import auto_pytest_magic
+from pynput.keyboard import Key
 
 from streamdeck_ui import api
 
@@ -16,3 +17,43 @@ auto_pytest_magic(api.change_brightness, auto_allow_exceptions_=(KeyError,))
 auto_pytest_magic(api.set_page)
 auto_pytest_magic(api.get_page)
 auto_pytest_magic(api.render)
+auto_pytest_magic(api.get_button_state)
+auto_pytest_magic(api.get_page_render_data, auto_allow_exceptions_=(KeyError,))
+auto_pytest_magic(api._parse_keys)
+auto_pytest_magic(api.get_compiled_macro)
+
+
+def test_parse_keys():
+    assert api._parse_keys("ctrl+plus,delay+Comma") == [[Key.ctrl, "+"], [0.5, ","]]
+    assert api._parse_keys("ctrl+plus,delay,Comma") == [[Key.ctrl, "+"], [0.5], [","]]
+
+
+def test_compiled_macro_cleared_on_change():
+    api.set_button_keys("macro_deck", 0, 0, "a")
+    api.set_button_keys("macro_deck", 0, 1, "b")
+    assert api.get_compiled_macro("macro_deck", 0, 0).key_sections == [["a"]]
+
+    api.set_button_keys("macro_deck", 0, 0, "c")
+    assert api.get_compiled_macro("macro_deck", 0, 0).key_sections == [["c"]]
+
+    api.swap_buttons("macro_deck", 0, 0, 1)
+    assert api.get_compiled_macro("macro_deck", 0, 0).key_sections == [["b"]]
+    assert api.get_compiled_macro("macro_deck", 0, 1).key_sections == [["c"]]
+
+
+def test_button_state_defaults_match_getters():
+    button_state = api.get_button_state("defaults_deck", 0, 0)
+    assert button_state.text == api.get_button_text("defaults_deck", 0, 0)
+    assert button_state.icon == api.get_button_icon("defaults_deck", 0, 0)
+    assert button_state.text_align == api.get_text_align("defaults_deck", 0, 0)
+    assert button_state.font_size == api.get_font_size("defaults_deck", 0, 0)
+    assert button_state.font_color == api.get_font_color("defaults_deck", 0, 0)
+    assert button_state.selected_font == api.get_selected_font("defaults_deck", 0, 0)
+    assert button_state.command == api.get_button_command("defaults_deck", 0, 0)
+    assert button_state.keys == api.get_button_keys("defaults_deck", 0, 0)
+    assert button_state.write == api.get_button_write("defaults_deck", 0, 0)
+    assert button_state.change_brightness == api.get_button_change_brightness(
+        "defaults_deck", 0, 0
+    )
+    assert button_state.switch_page == api.get_button_switch_page("defaults_deck", 0, 0)
+    assert button_state.target_device == api.get_target_device("defaults_deck", 0, 0)
@@ -10,16 +10,68 @@ pytestmark = pytest.mark.skipif(
     sys.platform == "linux", reason="tests for mac only due to travis issues"
 )
 
-gui.selected_button = MagicMock()
-
-auto_pytest_magic(gui.update_button_text, ui=MagicMock())
-auto_pytest_magic(gui.update_button_command, ui=MagicMock())
-auto_pytest_magic(gui.update_button_keys, ui=MagicMock())
-auto_pytest_magic(gui.update_button_write, ui=MagicMock())
 auto_pytest_magic(gui.update_change_brightness, ui=MagicMock())
 auto_pytest_magic(gui.change_page, ui=MagicMock())
 auto_pytest_magic(gui.set_brightness, ui=MagicMock(), auto_allow_exceptions_=(KeyError,))
-auto_pytest_magic(gui.queue_text_change, ui=MagicMock())
+auto_pytest_magic(gui.queue_change, ui=MagicMock(), setter=MagicMock())
+auto_pytest_magic(gui.flush_changes)
+
+
+def test_queued_change_applies_to_the_button_it_was_made_for(monkeypatch):
+    monkeypatch.setattr(gui, "_current", {"deck": "deck", "page": 1})
+    monkeypatch.setattr(gui, "pending_changes", {})
+    monkeypatch.setattr(gui, "change_timers", {})
+    monkeypatch.setattr(gui, "redraw_buttons", MagicMock())
+    ui = MagicMock()
+    ui.selected_index = 3
+    setter = MagicMock()
+    gui.queue_change("test", ui, setter, "value")
+
+    # Selecting another page and button before the change is applied
+    monkeypatch.setitem(gui._current, "deck", "other")
+    monkeypatch.setitem(gui._current, "page", 2)
+    ui.selected_index = 0
+    gui.flush_changes()
+
+    setter.assert_called_once_with("deck", 1, 3, "value")
+    gui.redraw_buttons.assert_called_once_with(ui)
+
+
+def test_dimmer_change_brightness(monkeypatch):
+    timeout_timer, change_timer = MagicMock(), MagicMock()
+    change_timer.isActive.return_value = False
+    monkeypatch.setattr(gui, "QTimer", MagicMock(side_effect=[timeout_timer, change_timer]))
+    now = [100.0]
+    monkeypatch.setattr(gui.time, "monotonic", lambda: now[0])
+    brightness_callback = MagicMock()
+
+    dimmer = gui.Dimmer(10, 50, brightness_callback)
+    dimmer.reset()
+    brightness_callback.assert_called_with(50)
+    change_timer.reset_mock()
+
+    # The first step starts the repeating change timer
+    dimmer.change_brightness()
+    brightness_callback.assert_called_with(49)
+    change_timer.start.assert_called_once_with(gui.DIMMER_TICK_MS)
+    change_timer.isActive.return_value = True
+
+    # A late tick catches up on all the steps that elapsed
+    now[0] += 0.035
+    dimmer.change_brightness()
+    brightness_callback.assert_called_with(46)
+    change_timer.stop.assert_not_called()
+
+    # Brightness stops at 0 and so does the timer
+    now[0] += 1
+    dimmer.change_brightness()
+    brightness_callback.assert_called_with(0)
+    change_timer.stop.assert_called_once()
+
+    change_timer.isActive.return_value = False
+    brightness_callback.reset_mock()
+    dimmer.change_brightness()
+    brightness_callback.assert_not_called()
 
 
 def test_start():